@@ -104,6 +104,13 @@ def _shutdown_managers():
         # Note: We don't clear the cache manager on unregister
         # to preserve cached data for next session
         
+        # Persist pending cache index changes
+        try:
+            cache_manager.flush()
+            logger.debug("Cache index flushed")
+        except Exception as e:
+            logger.warning(f"Error flushing cache index: {e}")
+        
         # Shutdown logger last
         try:
             logger.info("Pexels extension shutdown complete")
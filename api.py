@@ -36,6 +36,13 @@ USER_AGENT = "Blender/{major}.{minor} PexelsImageSearch/1.0".format(
 # Default timeout for API requests
 DEFAULT_TIMEOUT = 30.0
 
+# Retry policy for search requests
+SEARCH_RETRY_CONFIG = RetryConfig(
+    max_retries=3,
+    base_delay=1.0,
+    max_delay=10.0
+)
+
 
 class PexelsAPIError(Exception):
     """Base exception for Pexels API errors."""
@@ -173,17 +180,11 @@ def search_images(
             progress_callback(0.1, "Connecting to Pexels API...")
 
         # Make request with retry
-        retry_config = RetryConfig(
-            max_retries=3,
-            base_delay=1.0,
-            max_delay=10.0
-        )
-
         data, response_headers = network_manager.download_with_retry(
             url=url,
             headers=headers,
             timeout=timeout,
-            retry_config=retry_config,
+            retry_config=SEARCH_RETRY_CONFIG,
             cancellation_token=cancellation_token,
             on_progress=progress_callback
         )
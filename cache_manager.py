@@ -7,7 +7,10 @@ Thread-safe implementation with configurable limits and automatic cleanup.
 
 import os
 import json
+import atexit
+import functools
 import hashlib
+import heapq
 import time
 import threading
 import tempfile
@@ -15,9 +18,40 @@ from dataclasses import dataclass, field, asdict
 from typing import Optional, Dict, Any, Tuple
 from collections import OrderedDict
 from pathlib import Path
+from urllib.parse import urlparse
 
 
-@dataclass
+# File extensions for known image content types
+_CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/svg+xml': '.svg',
+}
+
+# URL extensions kept as-is for cached files
+_CACHEABLE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp'})
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_key(content: str) -> str:
+    """
+    Hash cache key content.
+    
+    Memoized because the same URLs are looked up repeatedly while
+    browsing and redrawing result grids.
+    
+    Args:
+        content: Key content (identifier plus optional variant)
+    
+    Returns:
+        SHA256 hash key (32 characters)
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:32]
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """
     Represents a cache entry with metadata.
@@ -39,11 +73,19 @@ class CacheEntry:
     expires_at: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
-    def is_expired(self) -> bool:
-        """Check if this cache entry has expired."""
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """
+        Check if this cache entry has expired.
+        
+        Args:
+            now: Current epoch time, to share one clock read across entries
+        
+        Returns:
+            True if the entry's TTL has passed
+        """
         if self.expires_at is None:
             return False
-        return time.time() > self.expires_at
+        return (time.time() if now is None else now) > self.expires_at
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -243,6 +285,8 @@ class CacheManager:
     MAX_MEMORY_ITEMS = 100  # Maximum items in memory cache
     DEFAULT_TTL_DAYS = 7    # Default TTL in days
     INDEX_FILENAME = "cache_index.json"
+    INDEX_SAVE_DELAY = 0.5  # Seconds to coalesce index changes before saving
+    ACCESS_UPDATE_INTERVAL = 60.0  # Min seconds between last_accessed updates
     
     def __new__(cls) -> 'CacheManager':
         """Singleton pattern implementation."""
@@ -265,18 +309,19 @@ class CacheManager:
         self._cache_dir = self._get_cache_directory()
         self._index_file = os.path.join(self._cache_dir, self.INDEX_FILENAME)
         
-        # Disk cache index
+        # Disk cache index (loaded on first disk access)
         self._index: Dict[str, CacheEntry] = {}
         self._index_lock = threading.RLock()
+        self._index_loaded = False
+        self._total_size = 0  # Running sum of entry sizes in the index
+        self._index_dirty = False
+        self._save_timer: Optional[threading.Timer] = None
         
         # Memory LRU cache
         self._memory_cache = LRUCache(max_items=self.MAX_MEMORY_ITEMS)
         
         # Statistics
         self._stats = CacheStats()
-        
-        # Load existing index
-        self._load_index()
     
     def _get_cache_directory(self) -> str:
         """
@@ -321,17 +366,63 @@ class CacheManager:
                 except (json.JSONDecodeError, IOError, KeyError) as e:
                     print(f"[CacheManager] Failed to load cache index: {e}")
                     self._index = {}
+            
+            self._total_size = sum(e.size_bytes for e in self._index.values())
+    
+    def _ensure_index_loaded(self) -> None:
+        """
+        Load the cache index on first disk access.
+        
+        Keeps construction (done at import time) free of index parsing
+        and per-entry file checks.
+        """
+        if self._index_loaded:
+            return
+        
+        with self._index_lock:
+            if not self._index_loaded:
+                self._load_index()
+                self._index_loaded = True
     
     def _save_index(self) -> None:
         """Save cache index to disk."""
         with self._index_lock:
             try:
                 data = {key: entry.to_dict() for key, entry in self._index.items()}
+                # Compact dumps() goes through the C encoder in one pass;
+                # dump() with indent falls back to the pure-Python encoder
+                # and writes chunk by chunk
+                payload = json.dumps(data, separators=(',', ':'))
                 with open(self._index_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                    f.write(payload)
             except IOError as e:
                 print(f"[CacheManager] Failed to save cache index: {e}")
     
+    def _schedule_index_save(self) -> None:
+        """
+        Mark the index dirty and schedule a deferred save.
+        
+        Coalesces bursts of index changes (e.g. a page of thumbnails being
+        cached, or an eviction pass) into a single write.
+        """
+        with self._index_lock:
+            self._index_dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.INDEX_SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending index changes to disk immediately."""
+        with self._index_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            
+            if self._index_dirty:
+                self._index_dirty = False
+                self._save_index()
+    
     def _generate_key(self, identifier: str, variant: str = "") -> str:
         """
         Generate a cache key from identifier and variant.
@@ -344,7 +435,7 @@ class CacheManager:
             SHA256 hash key (32 characters)
         """
         content = f"{identifier}:{variant}" if variant else identifier
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:32]
+        return _hash_key(content)
     
     def _get_file_extension(self, identifier: str, metadata: Optional[Dict] = None) -> str:
         """
@@ -359,23 +450,15 @@ class CacheManager:
         """
         # Try to get from metadata
         if metadata and 'content_type' in metadata:
-            content_type = metadata['content_type'].lower()
-            type_map = {
-                'image/jpeg': '.jpg',
-                'image/png': '.png',
-                'image/gif': '.gif',
-                'image/webp': '.webp',
-                'image/svg+xml': '.svg',
-            }
-            if content_type in type_map:
-                return type_map[content_type]
+            ext = _CONTENT_TYPE_EXTENSIONS.get(metadata['content_type'].lower())
+            if ext:
+                return ext
         
         # Try to extract from URL
         try:
-            from urllib.parse import urlparse
             path = urlparse(identifier).path
             ext = os.path.splitext(path)[1].lower()
-            if ext in ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.bmp'):
+            if ext in _CACHEABLE_EXTENSIONS:
                 return ext
         except Exception:
             pass
@@ -406,12 +489,14 @@ class CacheManager:
         
         # Check disk cache
         if cache_type in ('disk', 'both'):
+            self._ensure_index_loaded()
             with self._index_lock:
                 if key in self._index:
                     entry = self._index[key]
+                    now = time.time()
                     
                     # Check if expired
-                    if entry.is_expired():
+                    if entry.is_expired(now):
                         self._remove_entry(key)
                         self._stats.record_miss()
                         return None
@@ -427,9 +512,12 @@ class CacheManager:
                         with open(entry.file_path, 'rb') as f:
                             data = f.read()
                         
-                        # Update last accessed time
-                        entry.last_accessed = time.time()
-                        self._save_index()
+                        # Update last accessed time; repeated hits within
+                        # ACCESS_UPDATE_INTERVAL don't change LRU order
+                        # enough to be worth an index write
+                        if now - entry.last_accessed >= self.ACCESS_UPDATE_INTERVAL:
+                            entry.last_accessed = now
+                            self._schedule_index_save()
                         
                         # Add to memory cache
                         self._memory_cache.put(key, data)
@@ -478,26 +566,30 @@ class CacheManager:
             ext = self._get_file_extension(identifier, metadata)
             file_path = os.path.join(self._cache_dir, f"{key}{ext}")
             
+            self._ensure_index_loaded()
             with self._index_lock:
                 try:
                     # Write data to disk
                     with open(file_path, 'wb') as f:
                         f.write(data)
                     
+                    # Single timestamp for all fields of this write
+                    now = time.time()
+                    
                     # Calculate expiry time
                     expires_at = None
                     if ttl is not None:
-                        expires_at = time.time() + ttl
+                        expires_at = now + ttl
                     elif self.DEFAULT_TTL_DAYS > 0:
-                        expires_at = time.time() + (self.DEFAULT_TTL_DAYS * 24 * 60 * 60)
+                        expires_at = now + (self.DEFAULT_TTL_DAYS * 24 * 60 * 60)
                     
                     # Create index entry
                     entry = CacheEntry(
                         key=key,
                         file_path=file_path,
                         size_bytes=len(data),
-                        created_at=time.time(),
-                        last_accessed=time.time(),
+                        created_at=now,
+                        last_accessed=now,
                         expires_at=expires_at,
                         metadata=metadata or {}
                     )
@@ -507,8 +599,12 @@ class CacheManager:
                     if variant:
                         entry.metadata['variant'] = variant
                     
+                    previous = self._index.get(key)
+                    if previous is not None:
+                        self._total_size -= previous.size_bytes
                     self._index[key] = entry
-                    self._save_index()
+                    self._total_size += entry.size_bytes
+                    self._schedule_index_save()
                     
                     # Cleanup if needed
                     self._cleanup_if_needed()
@@ -536,6 +632,7 @@ class CacheManager:
             return True
         
         # Check disk cache
+        self._ensure_index_loaded()
         with self._index_lock:
             if key in self._index:
                 entry = self._index[key]
@@ -559,6 +656,7 @@ class CacheManager:
         """
         key = self._generate_key(identifier, variant)
         
+        self._ensure_index_loaded()
         with self._index_lock:
             if key in self._index:
                 entry = self._index[key]
@@ -586,6 +684,7 @@ class CacheManager:
         self._memory_cache.remove(key)
         
         # Remove from disk cache
+        self._ensure_index_loaded()
         return self._remove_entry(key)
     
     def _remove_entry(self, key: str) -> bool:
@@ -611,7 +710,8 @@ class CacheManager:
                 
                 # Remove from index
                 del self._index[key]
-                self._save_index()
+                self._total_size -= entry.size_bytes
+                self._schedule_index_save()
                 return True
         
         return False
@@ -619,21 +719,23 @@ class CacheManager:
     def _cleanup_if_needed(self) -> None:
         """Cleanup cache if size exceeds limit."""
         with self._index_lock:
-            total_size = sum(e.size_bytes for e in self._index.values())
             max_size = self.MAX_DISK_SIZE_MB * 1024 * 1024
             
-            if total_size > max_size:
-                # Sort by last accessed (oldest first)
-                sorted_entries = sorted(
-                    self._index.items(),
-                    key=lambda x: x[1].last_accessed
-                )
+            if self._total_size > max_size:
+                # Min-heap on last accessed (oldest first); only the
+                # entries actually evicted are popped. Ties go to the
+                # earliest-inserted entry, as with a stable sort, so a burst
+                # of puts within one clock tick never evicts the newest.
+                heap = [
+                    (entry.last_accessed, order, key)
+                    for order, (key, entry) in enumerate(self._index.items())
+                ]
+                heapq.heapify(heap)
                 
                 # Remove oldest until under 80% of limit
                 target_size = max_size * 0.8
-                while total_size > target_size and sorted_entries:
-                    key, entry = sorted_entries.pop(0)
-                    total_size -= entry.size_bytes
+                while self._total_size > target_size and heap:
+                    _, _, key = heapq.heappop(heap)
                     self._remove_entry(key)
     
     def cleanup_expired(self) -> int:
@@ -645,10 +747,12 @@ class CacheManager:
         """
         removed_count = 0
         
+        self._ensure_index_loaded()
         with self._index_lock:
+            now = time.time()
             expired_keys = [
                 key for key, entry in self._index.items()
-                if entry.is_expired()
+                if entry.is_expired(now)
             ]
             
             for key in expired_keys:
@@ -675,6 +779,7 @@ class CacheManager:
             self._memory_cache.clear()
         
         if cache_type in ('disk', 'both'):
+            self._ensure_index_loaded()
             with self._index_lock:
                 disk_cleared = len(self._index)
                 
@@ -688,7 +793,8 @@ class CacheManager:
                 
                 # Clear index
                 self._index.clear()
-                self._save_index()
+                self._total_size = 0
+                self._schedule_index_save()
         
         return memory_cleared, disk_cleared
     
@@ -699,8 +805,9 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics
         """
+        self._ensure_index_loaded()
         with self._index_lock:
-            total_disk_size = sum(e.size_bytes for e in self._index.values())
+            total_disk_size = self._total_size
             
             stats = self._stats.get_stats()
             stats.update({
@@ -728,6 +835,9 @@ class CacheManager:
 # Global instance
 cache_manager = CacheManager()
 
+# Persist pending index changes if Blender exits without unregistering
+atexit.register(cache_manager.flush)
+
 
 def get_cache_manager() -> CacheManager:
     """
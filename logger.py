@@ -7,15 +7,52 @@ with rotation, console logging, and contextual information.
 
 import os
 import sys
+import glob
 import time
+import queue
+import itertools
 import threading
 import traceback
 import tempfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
-from typing import Optional, Dict, Any, TextIO
+from types import MappingProxyType
+from typing import Optional, Dict, Any, BinaryIO
 from pathlib import Path
-from collections import deque
+
+
+# Package prefix stripped from caller module names
+_MODULE_PREFIX = 'pexels_ext.'
+_MODULE_PREFIX_LEN = len(_MODULE_PREFIX)
+
+# Shared read-only context for records logged without context data
+_EMPTY_CONTEXT = MappingProxyType({})
+
+# (epoch second, formatted "YYYY-mm-dd HH:MM:SS") of the last formatted
+# record; swapped as one tuple so concurrent formatters never mix fields
+_second_cache: tuple = (None, "")
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """
+    Format a timestamp as 'YYYY-mm-dd HH:MM:SS.mmm'.
+    
+    strftime runs once per wall-clock second; records within the same
+    second reuse the cached prefix and only append milliseconds.
+    
+    Args:
+        timestamp: Epoch timestamp (as returned by time.time())
+    
+    Returns:
+        Formatted local-time timestamp string
+    """
+    global _second_cache
+    second = int(timestamp)
+    cached_second, prefix = _second_cache
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _second_cache = (second, prefix)
+    return f"{prefix}.{int((timestamp - second) * 1000):03d}"
 
 
 class LogLevel(IntEnum):
@@ -27,12 +64,23 @@ class LogLevel(IntEnum):
     CRITICAL = 50
 
 
+# Full console prefixes, built once rather than per format_short() call
+_CONSOLE_PREFIX = {
+    LogLevel.DEBUG: "[Pexels] 🔍 ",
+    LogLevel.INFO: "[Pexels] ℹ️ ",
+    LogLevel.WARNING: "[Pexels] ⚠️ ",
+    LogLevel.ERROR: "[Pexels] ❌ ",
+    LogLevel.CRITICAL: "[Pexels] 🔥 "
+}
+_CONSOLE_PREFIX_DEFAULT = "[Pexels] • "
+
+
 class LogRecord:
     """
     Represents a single log record.
     
     Attributes:
-        timestamp: When the log was created
+        timestamp: When the log was created (epoch seconds)
         level: Log level
         message: Log message
         module: Module name where log originated
@@ -52,18 +100,35 @@ class LogRecord:
         context: Optional[Dict[str, Any]] = None,
         exception: Optional[Exception] = None
     ):
-        self.timestamp = datetime.now()
+        self.timestamp = time.time()
         self.level = level
         self.message = message
         self.module = module
         self.function = function
         self.line = line
-        self.context = context or {}
+        self.context = context if context else _EMPTY_CONTEXT
         self.exception = exception
-        self.exception_traceback = ""
+        self._tb_cache: Optional[str] = None
+    
+    @property
+    def exception_traceback(self) -> str:
+        """
+        Formatted traceback of the attached exception.
         
-        if exception:
-            self.exception_traceback = traceback.format_exc()
+        Formatting is deferred until the record is actually written, so
+        the logging call itself only keeps a reference to the exception.
+        
+        Returns:
+            Traceback text, or an empty string if there is no exception
+        """
+        if self.exception is None:
+            return ""
+        if self._tb_cache is None:
+            exc = self.exception
+            self._tb_cache = "".join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)
+            )
+        return self._tb_cache
     
     def format(self, include_context: bool = True) -> str:
         """
@@ -76,7 +141,7 @@ class LogRecord:
             Formatted log string
         """
         # Format timestamp
-        ts = self.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        ts = _format_timestamp(self.timestamp)
         
         # Format level
         level_name = self.level.name
@@ -98,7 +163,7 @@ class LogRecord:
         
         # Add context
         if include_context and self.context:
-            context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
+            context_str = ", ".join([f"{k}={v}" for k, v in self.context.items()])
             formatted += f" ({context_str})"
         
         # Add exception
@@ -114,15 +179,7 @@ class LogRecord:
         Returns:
             Short formatted log string
         """
-        level_prefix = {
-            LogLevel.DEBUG: "🔍",
-            LogLevel.INFO: "ℹ️",
-            LogLevel.WARNING: "⚠️",
-            LogLevel.ERROR: "❌",
-            LogLevel.CRITICAL: "🔥"
-        }.get(self.level, "•")
-        
-        return f"[Pexels] {level_prefix} {self.message}"
+        return _CONSOLE_PREFIX.get(self.level, _CONSOLE_PREFIX_DEFAULT) + self.message
 
 
 class RotatingFileHandler:
@@ -130,9 +187,13 @@ class RotatingFileHandler:
     File handler with log rotation.
     
     Rotates log files when they exceed max_bytes, keeping up to
-    backup_count old files.
+    backup_count old files. The file is opened in binary mode and each
+    write is encoded once; data goes through a BUFFER_SIZE userspace
+    buffer and only reaches the OS on flush(), rotation or close.
     """
     
+    BUFFER_SIZE = 64 * 1024
+    
     def __init__(
         self,
         filepath: str,
@@ -154,18 +215,30 @@ class RotatingFileHandler:
         self.backup_count = backup_count
         self.encoding = encoding
         self._lock = threading.Lock()
-        self._file: Optional[TextIO] = None
+        self._file: Optional[BinaryIO] = None
+        self._bytes_written = 0
+        
+        # Backup renames run here, off the writer's path
+        self._rotation_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="PexelsLogRotate"
+        )
+        self._rotation_count = 0
+        self._pending_prefix = f"{filepath}.pending{os.getpid()}-"
         
         # Ensure directory exists
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
+        # Drop pending files left behind by a previous session
+        self._rotation_executor.submit(self._remove_stale_pending)
+        
         # Open file
         self._open_file()
     
     def _open_file(self) -> None:
         """Open the log file."""
         try:
-            self._file = open(self.filepath, 'a', encoding=self.encoding)
+            self._file = open(self.filepath, 'ab', buffering=self.BUFFER_SIZE)
+            self._bytes_written = self._file.tell()
         except IOError as e:
             print(f"[Logger] Failed to open log file: {e}")
             self._file = None
@@ -175,17 +248,59 @@ class RotatingFileHandler:
         if self._file is None:
             return False
         
-        try:
-            return os.path.getsize(self.filepath) >= self.max_bytes
-        except OSError:
-            return False
+        # Tracked on write instead of stat()ing the file for every batch
+        return self._bytes_written >= self.max_bytes
     
     def _rotate(self) -> None:
-        """Rotate log files."""
+        """
+        Rotate log files.
+        
+        Only the current file is renamed inline (to a pending name) before
+        a fresh file is opened; shifting the numbered backups is handed to
+        the rotation worker so the writer doesn't wait on it.
+        """
         if self._file:
             self._file.close()
             self._file = None
         
+        pending_path = None
+        if os.path.exists(self.filepath):
+            self._rotation_count += 1
+            pending_path = f"{self._pending_prefix}{self._rotation_count}"
+            try:
+                os.replace(self.filepath, pending_path)
+            except OSError:
+                pending_path = None
+        
+        # Open new file
+        self._open_file()
+        
+        if pending_path:
+            self._rotation_executor.submit(self._shift_backups, pending_path)
+        else:
+            # Couldn't move the file aside; retry after another max_bytes
+            # instead of on every write
+            self._bytes_written = 0
+    
+    def _remove_stale_pending(self) -> None:
+        """Remove rotated files that a previous session never moved to a backup."""
+        for path in glob.glob(glob.escape(self.filepath) + ".pending*"):
+            if path.startswith(self._pending_prefix):
+                continue  # Queued by this session
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _shift_backups(self, pending_path: str) -> None:
+        """
+        Shift numbered backups up by one and move the rotated file to .1.
+        
+        Runs on the single rotation worker, so rotations apply in order.
+        
+        Args:
+            pending_path: Path the rotated log file was renamed to
+        """
         # Rotate existing backup files
         for i in range(self.backup_count - 1, 0, -1):
             src = f"{self.filepath}.{i}"
@@ -193,31 +308,23 @@ class RotatingFileHandler:
             
             if os.path.exists(src):
                 try:
-                    if os.path.exists(dst):
-                        os.remove(dst)
-                    os.rename(src, dst)
+                    os.replace(src, dst)
                 except OSError:
                     pass
         
-        # Rename current file to .1
-        if os.path.exists(self.filepath):
-            try:
-                backup_path = f"{self.filepath}.1"
-                if os.path.exists(backup_path):
-                    os.remove(backup_path)
-                os.rename(self.filepath, backup_path)
-            except OSError:
-                pass
-        
-        # Open new file
-        self._open_file()
+        # Rename rotated file to .1
+        try:
+            os.replace(pending_path, f"{self.filepath}.1")
+        except OSError:
+            pass
     
-    def write(self, message: str) -> None:
+    def write(self, message: str, flush: bool = False) -> None:
         """
         Write message to log file.
         
         Args:
             message: Message to write
+            flush: Whether to flush the buffer to the OS after writing
         """
         with self._lock:
             if self._should_rotate():
@@ -225,13 +332,24 @@ class RotatingFileHandler:
             
             if self._file:
                 try:
-                    self._file.write(message + "\n")
+                    data = (message + "\n").encode(self.encoding, errors='replace')
+                    self._bytes_written += self._file.write(data)
+                    if flush:
+                        self._file.flush()
+                except IOError:
+                    pass
+    
+    def flush(self) -> None:
+        """Flush buffered log data to the OS."""
+        with self._lock:
+            if self._file:
+                try:
                     self._file.flush()
                 except IOError:
                     pass
     
     def close(self) -> None:
-        """Close the log file."""
+        """Close the log file and wait for pending rotations."""
         with self._lock:
             if self._file:
                 try:
@@ -239,6 +357,8 @@ class RotatingFileHandler:
                 except IOError:
                     pass
                 self._file = None
+        
+        self._rotation_executor.shutdown(wait=True)
 
 
 class Logger:
@@ -251,6 +371,7 @@ class Logger:
     - Console logging for Blender's console
     - Contextual logging (module, function, line)
     - Thread-safe operation
+    - Background writer thread for file output
     - In-memory log buffer for recent logs
     
     Usage:
@@ -263,6 +384,10 @@ class Logger:
         
         # Debug logging (only shown if level is DEBUG)
         logger.debug("Cache hit", key="abc123")
+        
+        # Skip building expensive messages when the level is filtered
+        if logger.debug_enabled:
+            logger.debug(f"Items: {describe(items)}")
     """
     
     _instance: Optional['Logger'] = None
@@ -273,6 +398,9 @@ class Logger:
     DEFAULT_LOG_FILE = "pexels.log"
     DEFAULT_LEVEL = LogLevel.INFO
     MAX_BUFFER_SIZE = 1000  # Keep last 1000 log entries in memory
+    MAX_WRITE_BATCH = 64    # Max records formatted into a single file write
+    MAX_QUEUE_SIZE = 10000  # Records waiting for the writer before new ones are dropped
+    FLUSH_INTERVAL = 1.0    # Max seconds written records may sit unflushed
     
     def __new__(cls) -> 'Logger':
         """Singleton pattern implementation."""
@@ -294,15 +422,35 @@ class Logger:
         
         # Configuration
         self._level = self.DEFAULT_LEVEL
+        self._update_level_flags()
         self._console_enabled = True
         self._file_enabled = True
+        self._capture_caller = False  # Caller info is always captured at DEBUG
         
         # File handler
         self._file_handler: Optional[RotatingFileHandler] = None
         self._setup_file_handler()
         
-        # In-memory buffer
-        self._buffer: deque = deque(maxlen=self.MAX_BUFFER_SIZE)
+        # In-memory ring buffer of (seq, record) slots; once full, the
+        # oldest slot is overwritten. Producers reserve slots from
+        # _ring_counter without taking a lock (next() on itertools.count is
+        # atomic under the GIL), and readers skip slots whose seq doesn't
+        # match the one they expect.
+        self._ring: list = [None] * self.MAX_BUFFER_SIZE
+        self._ring_counter = itertools.count()
+        self._ring_seq = 0  # One past the newest published sequence number
+        
+        # File records are formatted and written by a background thread.
+        # The queue is bounded so a stalled writer can't grow it forever;
+        # records that don't fit are counted and reported in the file.
+        self._queue: queue.Queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self._dropped_records = 0
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="PexelsLogWriter",
+            daemon=True
+        )
+        self._writer_thread.start()
     
     def _setup_file_handler(self) -> None:
         """Set up the file handler."""
@@ -361,8 +509,8 @@ class Logger:
             line = frame.f_lineno
             
             # Simplify module name
-            if module.startswith('pexels_ext.'):
-                module = module[11:]  # Remove 'pexels_ext.' prefix
+            if module.startswith(_MODULE_PREFIX):
+                module = module[_MODULE_PREFIX_LEN:]
             
             return module, function, line
         except Exception:
@@ -387,8 +535,12 @@ class Logger:
         if level < self._level:
             return
         
-        # Get caller info
-        module, function, line = self._get_caller_info()
+        # Get caller info; the frame walk is costly, so it's opt-in
+        # outside of DEBUG level
+        if self._capture_caller or self.debug_enabled:
+            module, function, line = self._get_caller_info()
+        else:
+            module, function, line = "", "", 0
         
         # Create log record
         record = LogRecord(
@@ -401,17 +553,106 @@ class Logger:
             exception=exception
         )
         
-        with self._lock:
-            # Add to buffer
-            self._buffer.append(record)
-            
-            # Write to console
-            if self._console_enabled:
+        # Add to ring buffer
+        seq = next(self._ring_counter)
+        self._ring[seq % self.MAX_BUFFER_SIZE] = (seq, record)
+        # Unlocked read-modify-write: a slower producer can still lower the
+        # watermark, briefly hiding the newest record until the next log
+        self._ring_seq = max(self._ring_seq, seq + 1)
+        
+        # Write to console (locked so concurrent lines don't interleave)
+        if self._console_enabled:
+            with self._lock:
                 self._write_console(record)
+        
+        # Hand off to the writer thread; never block the caller
+        if self._file_enabled and self._file_handler:
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                self._dropped_records += 1
+    
+    def _writer_loop(self) -> None:
+        """
+        Background loop that formats queued records and writes them to file.
+        
+        Drains up to MAX_WRITE_BATCH records at a time into a single write.
+        Output is flushed right away for ERROR and above, otherwise at most
+        FLUSH_INTERVAL after the oldest unflushed write, whether or not
+        more records keep arriving. Exits when it receives the None
+        sentinel from shutdown(); a record that fails to format or write
+        never ends the loop.
+        """
+        pending_since = None  # Monotonic time of the oldest unflushed write
+        while True:
+            if pending_since is None:
+                timeout = None
+            else:
+                timeout = max(0.0, pending_since + self.FLUSH_INTERVAL - time.monotonic())
+            
+            try:
+                record = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                handler = self._file_handler
+                if handler:
+                    handler.flush()
+                pending_since = None
+                continue
+            
+            if record is None:
+                return
             
-            # Write to file
-            if self._file_enabled and self._file_handler:
-                self._file_handler.write(record.format())
+            batch = [self._format_for_file(record)]
+            urgent = record.level >= LogLevel.ERROR
+            stop = False
+            while len(batch) < self.MAX_WRITE_BATCH:
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(self._format_for_file(record))
+                urgent = urgent or record.level >= LogLevel.ERROR
+            
+            # Racy read/reset from producer threads; the count is approximate
+            dropped = self._dropped_records
+            if dropped:
+                self._dropped_records = 0
+                batch.append(f"<{dropped} log records dropped: writer queue full>")
+            
+            handler = self._file_handler
+            if handler:
+                now = time.monotonic()
+                if pending_since is None:
+                    pending_since = now
+                flush = urgent or now - pending_since >= self.FLUSH_INTERVAL
+                try:
+                    handler.write("\n".join(batch), flush=flush)
+                except Exception as e:
+                    print(f"[Logger] Failed to write log batch: {e!r}")
+                if flush:
+                    pending_since = None
+            
+            if stop:
+                return
+    
+    @staticmethod
+    def _format_for_file(record: LogRecord) -> str:
+        """
+        Format a record for the log file without raising.
+        
+        Args:
+            record: Queued log record
+        
+        Returns:
+            Formatted line, or a placeholder if the record can't be formatted
+        """
+        try:
+            return record.format()
+        except Exception as e:
+            return f"<unformattable record: {e!r}>"
     
     def _write_console(self, record: LogRecord) -> None:
         """
@@ -433,6 +674,11 @@ class Logger:
         except Exception:
             pass
     
+    def _update_level_flags(self) -> None:
+        """Refresh the cached per-level enabled flags from the current level."""
+        self.debug_enabled = self._level <= LogLevel.DEBUG
+        self.info_enabled = self._level <= LogLevel.INFO
+    
     def debug(self, message: str, **context) -> None:
         """
         Log a debug message.
@@ -441,6 +687,8 @@ class Logger:
             message: Log message
             **context: Additional context data
         """
+        if not self.debug_enabled:
+            return
         self._log(LogLevel.DEBUG, message, **context)
     
     def info(self, message: str, **context) -> None:
@@ -451,6 +699,8 @@ class Logger:
             message: Log message
             **context: Additional context data
         """
+        if not self.info_enabled:
+            return
         self._log(LogLevel.INFO, message, **context)
     
     def warning(self, message: str, **context) -> None:
@@ -508,6 +758,7 @@ class Logger:
         """
         with self._lock:
             self._level = level
+            self._update_level_flags()
     
     def get_level(self) -> LogLevel:
         """
@@ -538,6 +789,18 @@ class Logger:
         with self._lock:
             self._file_enabled = enabled
     
+    def enable_caller_info(self, enabled: bool = True) -> None:
+        """
+        Enable or disable caller info (module, function, line) on records.
+        
+        Caller info is always captured when the level is DEBUG.
+        
+        Args:
+            enabled: Whether to capture caller info at all levels
+        """
+        with self._lock:
+            self._capture_caller = enabled
+    
     def get_recent_logs(
         self,
         count: int = 100,
@@ -553,13 +816,27 @@ class Logger:
         Returns:
             List of LogRecord objects
         """
-        with self._lock:
-            logs = list(self._buffer)
-            
-            if min_level is not None:
-                logs = [r for r in logs if r.level >= min_level]
-            
-            return logs[-count:]
+        ring = self._ring
+        size = self.MAX_BUFFER_SIZE
+        newest = self._ring_seq
+        oldest = max(0, newest - size)
+        
+        # Walk back from the newest record, touching only what's needed.
+        # A slot whose seq differs is either not filled yet (still None, or
+        # holding the record from a lap earlier) or already overwritten by
+        # a newer lap; both are skipped.
+        logs = []
+        seq = newest - 1
+        while seq >= oldest and len(logs) < count:
+            slot = ring[seq % size]
+            if slot is not None and slot[0] == seq:
+                record = slot[1]
+                if min_level is None or record.level >= min_level:
+                    logs.append(record)
+            seq -= 1
+        
+        logs.reverse()
+        return logs
     
     def get_log_file_path(self) -> Optional[str]:
         """
@@ -575,56 +852,37 @@ class Logger:
     def clear_buffer(self) -> None:
         """Clear the in-memory log buffer."""
         with self._lock:
-            self._buffer.clear()
+            self._ring = [None] * self.MAX_BUFFER_SIZE
+            self._ring_counter = itertools.count()
+            self._ring_seq = 0
     
     def shutdown(self) -> None:
-        """Shutdown the logger and close file handlers."""
+        """Shutdown the logger, flush queued records and close file handlers."""
+        if self._writer_thread.is_alive():
+            try:
+                self._queue.put(None, timeout=2.0)
+                self._writer_thread.join(timeout=2.0)
+            except queue.Full:
+                pass
+        
         with self._lock:
             if self._file_handler:
                 self._file_handler.close()
                 self._file_handler = None
 
 
-# Convenience functions for module-level logging
-_logger: Optional[Logger] = None
-
-
-def _get_logger() -> Logger:
-    """Get or create the global logger instance."""
-    global _logger
-    if _logger is None:
-        _logger = Logger()
-    return _logger
-
-
-def debug(message: str, **context) -> None:
-    """Log a debug message."""
-    _get_logger().debug(message, **context)
-
-
-def info(message: str, **context) -> None:
-    """Log an info message."""
-    _get_logger().info(message, **context)
-
-
-def warning(message: str, **context) -> None:
-    """Log a warning message."""
-    _get_logger().warning(message, **context)
-
-
-def error(message: str, exception: Optional[Exception] = None, **context) -> None:
-    """Log an error message."""
-    _get_logger().error(message, exception=exception, **context)
-
-
-def critical(message: str, exception: Optional[Exception] = None, **context) -> None:
-    """Log a critical message."""
-    _get_logger().critical(message, exception=exception, **context)
+# Global logger instance
+logger = Logger()
 
 
-def set_level(level: LogLevel) -> None:
-    """Set the minimum log level."""
-    _get_logger().set_level(level)
+# Convenience functions for module-level logging. These are the global
+# instance's bound methods, so a call costs no more than logger.<level>().
+debug = logger.debug
+info = logger.info
+warning = logger.warning
+error = logger.error
+critical = logger.critical
+set_level = logger.set_level
 
 
 def get_logger() -> Logger:
@@ -634,8 +892,4 @@ def get_logger() -> Logger:
     Returns:
         Logger instance
     """
-    return _get_logger()
-
-
-# Global logger instance
-logger = Logger()
\ No newline at end of file
+    return logger
@@ -5,13 +5,14 @@ Provides network utilities including connectivity checking, retry logic
 with exponential backoff, and Blender online access preference checking.
 """
 
+import json
 import urllib.request
 import urllib.error
 import socket
 import time
 import threading
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional, Tuple, Dict, Any, Callable
 
@@ -64,11 +65,13 @@ class HTTPError(NetworkError):
         super().__init__(self.message)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """
     Configuration for retry logic with exponential backoff.
     
+    Immutable, so a single instance can be shared by every request.
+    
     Attributes:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds
@@ -82,12 +85,10 @@ class RetryConfig:
     max_delay: float = 30.0
     exponential_base: float = 2.0
     jitter: float = 0.1
-    retryable_status_codes: Tuple[int, ...] = field(
-        default_factory=lambda: (429, 500, 502, 503, 504)
-    )
+    retryable_status_codes: Tuple[int, ...] = (429, 500, 502, 503, 504)
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadProgress:
     """
     Download progress information.
@@ -144,6 +145,7 @@ class NetworkManager:
     
     # Default configuration
     DEFAULT_TIMEOUT = 30.0  # seconds
+    DEFAULT_RETRY_CONFIG = RetryConfig()
     CONNECTIVITY_CHECK_INTERVAL = 30.0  # seconds
     CONNECTIVITY_CHECK_TIMEOUT = 5.0  # seconds
     
@@ -447,7 +449,7 @@ class NetworkManager:
         # Check online access preference
         self._ensure_online_access()
         
-        config = retry_config or RetryConfig()
+        config = retry_config or self.DEFAULT_RETRY_CONFIG
         last_error: Optional[Exception] = None
         
         for attempt in range(config.max_retries + 1):
@@ -541,8 +543,6 @@ class NetworkManager:
             HTTPError: For HTTP errors
             ValueError: If response is not valid JSON
         """
-        import json
-        
         data, headers_out = self.download_with_retry(
             url=url,
             headers=headers,
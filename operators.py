@@ -6,6 +6,8 @@ Provides operators for searching, importing, and managing Pexels images
 with background task support, progress tracking, and proper error handling.
 """
 
+import time
+
 import bpy
 import gpu
 from gpu_extras.batch import batch_for_shader
@@ -89,6 +91,34 @@ def get_state(context):
         return None
 
 
+def resolve_thumb_url(photo_data: dict) -> str:
+    """
+    Resolve the thumbnail URL of a Pexels photo.
+    
+    Args:
+        photo_data: Photo dictionary from the API response
+    
+    Returns:
+        Preferred thumbnail URL, or an empty string if none is available
+    """
+    src = photo_data.get("src") or {}
+    return src.get("medium") or src.get("small") or src.get("tiny") or ""
+
+
+def resolve_full_url(photo_data: dict) -> str:
+    """
+    Resolve the full-resolution URL of a Pexels photo.
+    
+    Args:
+        photo_data: Photo dictionary from the API response
+    
+    Returns:
+        Preferred full-size URL, or an empty string if none is available
+    """
+    src = photo_data.get("src") or {}
+    return src.get("large2x") or src.get("original") or src.get("large") or ""
+
+
 class PEXELS_OT_Search(bpy.types.Operator):
     """Search for images on Pexels"""
     
@@ -219,11 +249,7 @@ class PEXELS_OT_Search(bpy.types.Operator):
                     raise InterruptedError("Search cancelled")
                 
                 photo_id = photo.get("id")
-                thumb_url = (
-                    photo.get("src", {}).get("medium") or
-                    photo.get("src", {}).get("small") or
-                    photo.get("src", {}).get("tiny")
-                )
+                thumb_url = resolve_thumb_url(photo)
                 
                 if thumb_url and photo_id:
                     try:
@@ -373,18 +399,9 @@ class PEXELS_OT_Search(bpy.types.Operator):
         item.width = int(photo_data.get("width", 0) or 0)
         item.height = int(photo_data.get("height", 0) or 0)
         
-        # Extract image URLs
-        src = photo_data.get("src", {}) or {}
-        item.thumb_url = (
-            src.get("medium") or 
-            src.get("small") or 
-            src.get("tiny") or ""
-        )
-        item.full_url = (
-            src.get("large2x") or 
-            src.get("original") or 
-            src.get("large") or ""
-        )
+        # Extract image URLs once; the item keeps the resolved values
+        item.thumb_url = resolve_thumb_url(photo_data)
+        item.full_url = resolve_full_url(photo_data)
     
     def _set_default_selection(self, state, context):
         """Set default selection after search."""
@@ -1150,8 +1167,6 @@ class PEXELS_OT_CacheImages(bpy.types.Operator):
     
     def execute(self, context):
         """Execute the caching operation."""
-        import time
-        
         state = get_state(context)
         prefs = get_preferences(context)
         
@@ -1272,12 +1287,10 @@ class PEXELS_OT_CacheImages(bpy.types.Operator):
         Returns:
             Dict with cached_count and failed_count
         """
-        import time as time_module
-        
         cached_count = 0
         failed_count = 0
         total = len(urls_to_cache)
-        start_time = time_module.time()
+        start_time = time.time()
         total_bytes = 0
         
         for i, item_info in enumerate(urls_to_cache):
@@ -1291,7 +1304,7 @@ class PEXELS_OT_CacheImages(bpy.types.Operator):
             
             if progress_callback:
                 progress = (i / total)
-                elapsed = time_module.time() - start_time
+                elapsed = time.time() - start_time
                 speed = total_bytes / elapsed if elapsed > 0 else 0
                 
                 # Calculate ETA
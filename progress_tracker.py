@@ -23,7 +23,7 @@ class ProgressStatus(Enum):
     ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressState:
     """
     Current progress state snapshot.
@@ -332,10 +332,14 @@ class PEXELS_State(bpy.types.PropertyGroup):
         # Use persistent Blender property for storage
         value = self.selected_icon_storage if self.selected_icon_storage else None
         
-        logger.debug(f"[DEBUG] _get_selected_icon called, stored value: '{value}'")
+        # Called on every redraw; skip building debug strings unless needed
+        debug = logger.debug_enabled
+        if debug:
+            logger.debug(f"[DEBUG] _get_selected_icon called, stored value: '{value}'")
         
         if value is None or value == "":
-            logger.debug("[DEBUG] _get_selected_icon: No stored value, returning 0")
+            if debug:
+                logger.debug("[DEBUG] _get_selected_icon: No stored value, returning 0")
             return 0
         
         # Find the index of the stored identifier in current enum items
@@ -348,12 +352,15 @@ class PEXELS_State(bpy.types.PropertyGroup):
             
             with _enum_items_lock:
                 enum_items = pexels_enum_items(self, context)
-                logger.debug(f"[DEBUG] _get_selected_icon: enum_items count = {len(enum_items)}")
+                if debug:
+                    logger.debug(f"[DEBUG] _get_selected_icon: enum_items count = {len(enum_items)}")
                 for i, item in enumerate(enum_items):
                     if item[0] == value:  # item[0] is the identifier
-                        logger.debug(f"[DEBUG] _get_selected_icon: Found match at index {i} for '{value}'")
+                        if debug:
+                            logger.debug(f"[DEBUG] _get_selected_icon: Found match at index {i} for '{value}'")
                         return i
-                logger.debug(f"[DEBUG] _get_selected_icon: No match found for '{value}' in enum items")
+                if debug:
+                    logger.debug(f"[DEBUG] _get_selected_icon: No match found for '{value}' in enum items")
         except Exception as e:
             logger.warning(f"[DEBUG] _get_selected_icon exception: {e}")
         
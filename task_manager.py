@@ -30,7 +30,7 @@ class TaskStatus(IntEnum):
     CANCELLED = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """
     Represents a background task with all its metadata and callbacks.
@@ -319,7 +319,7 @@ class TaskManager:
         Returns:
             Task ID string
         """
-        task_id = str(uuid.uuid4())
+        task_id = uuid.uuid4().hex
         
         task = Task(
             id=task_id,
@@ -577,6 +577,41 @@ preview_manager = PreviewManager()
 # Formatting Helper Functions
 # ============================================================================
 
+# Binary unit names, indexed by power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+_SPEED_UNITS = ("B/s", "KB/s", "MB/s", "GB/s")
+
+
+def _format_scaled(value: float, units: tuple) -> str:
+    """
+    Scale a positive byte count to the largest fitting binary unit.
+    
+    The unit is picked from the integer part's bit length instead of
+    comparing against each threshold in turn.
+    
+    Args:
+        value: Byte count (or rate), greater than zero
+        units: Unit names for 1024^0, 1024^1, ...
+    
+    Returns:
+        Formatted string with 3 significant digits (e.g., '1.50 MB')
+    """
+    index = (int(value).bit_length() - 1) // 10
+    if index < 0:
+        # Below one byte
+        return f"0 {units[0]}"
+    if index >= len(units):
+        index = len(units) - 1
+    
+    scaled = value / (1 << (10 * index))
+    if scaled >= 100:
+        return f"{int(scaled)} {units[index]}"
+    elif scaled >= 10:
+        return f"{scaled:.1f} {units[index]}"
+    else:
+        return f"{scaled:.2f} {units[index]}"
+
+
 def format_eta(seconds: int) -> str:
     """
     Format seconds as human-readable time.
@@ -619,25 +654,7 @@ def format_speed(bytes_per_sec: float) -> str:
     if bytes_per_sec <= 0:
         return "0 B/s"
     
-    # Define units
-    units = [
-        (1024 ** 3, "GB/s"),
-        (1024 ** 2, "MB/s"),
-        (1024, "KB/s"),
-        (1, "B/s")
-    ]
-    
-    for threshold, unit in units:
-        if bytes_per_sec >= threshold:
-            value = bytes_per_sec / threshold
-            if value >= 100:
-                return f"{int(value)} {unit}"
-            elif value >= 10:
-                return f"{value:.1f} {unit}"
-            else:
-                return f"{value:.2f} {unit}"
-    
-    return f"{int(bytes_per_sec)} B/s"
+    return _format_scaled(bytes_per_sec, _SPEED_UNITS)
 
 
 def truncate_filename(filename: str, max_length: int = 30) -> str:
@@ -692,24 +709,7 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes <= 0:
         return "0 B"
     
-    units = [
-        (1024 ** 3, "GB"),
-        (1024 ** 2, "MB"),
-        (1024, "KB"),
-        (1, "B")
-    ]
-    
-    for threshold, unit in units:
-        if size_bytes >= threshold:
-            value = size_bytes / threshold
-            if value >= 100:
-                return f"{int(value)} {unit}"
-            elif value >= 10:
-                return f"{value:.1f} {unit}"
-            else:
-                return f"{value:.2f} {unit}"
-    
-    return f"{int(size_bytes)} B"
+    return _format_scaled(size_bytes, _SIZE_UNITS)
 
 
 def format_progress_items(done: int, total: int) -> str: